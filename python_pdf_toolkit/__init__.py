@@ -8,24 +8,66 @@ including compression, conversion, encryption, and merging functionality.
 __version__ = "0.1.1"
 __author__ = "Tharakeshavn Parthasarathy"
 
-from .compressor import PDFCompressor
-from .converter import PDFToExcelConverter, PDFToWordConverter
-from .encryption import PDFEncryptor
-from .merger import PDFMerger
-from .validators import validate_pdf
+from functools import cached_property
+from importlib import import_module
+
 from .logger import setup_logger
 
+# Public names imported on first access (PEP 562), so that importing the
+# package or running the CLI does not load pypdf, pdfplumber and friends
+# until a command actually needs them
+_LAZY_ATTRIBUTES = {
+    "PDFCompressor": ".compressor",
+    "PDFToExcelConverter": ".converter",
+    "PDFToWordConverter": ".converter",
+    "PDFEncryptor": ".encryption",
+    "PDFMerger": ".merger",
+    "validate_pdf": ".validators",
+}
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
 class PDFToolkit:    
     def __init__(self, logger=None):
         """
         Initialize the PDFToolkit with optional logger.
         
+        Components are created on first use.
+        
         Args:
             logger: Optional logger instance. If None, a default logger will be used.
         """
         self.logger = logger if logger else setup_logger("PDFToolkit")
-        self.compressor = PDFCompressor(logger=self.logger)
-        self.excel_converter = PDFToExcelConverter(logger=self.logger)
-        self.word_converter = PDFToWordConverter(logger=self.logger)
-        self.encryptor = PDFEncryptor(logger=self.logger)
-        self.merger = PDFMerger(logger=self.logger)
\ No newline at end of file
+    
+    @cached_property
+    def compressor(self):
+        from .compressor import PDFCompressor
+        return PDFCompressor(logger=self.logger)
+    
+    @cached_property
+    def excel_converter(self):
+        from .converter import PDFToExcelConverter
+        return PDFToExcelConverter(logger=self.logger)
+    
+    @cached_property
+    def word_converter(self):
+        from .converter import PDFToWordConverter
+        return PDFToWordConverter(logger=self.logger)
+    
+    @cached_property
+    def encryptor(self):
+        from .encryption import PDFEncryptor
+        return PDFEncryptor(logger=self.logger)
+    
+    @cached_property
+    def merger(self):
+        from .merger import PDFMerger
+        return PDFMerger(logger=self.logger)
@@ -37,12 +37,17 @@ def parse_args(args: Optional[List[str]] = None):
     compress_parser.add_argument("input_pdf", help="Input PDF file path")
     compress_parser.add_argument("output_pdf", help="Output PDF file path")
     compress_parser.add_argument("--level", "-l", type=int, choices=range(1, 11), default=5, help="Compression level (1-10)")
+    compress_parser.add_argument("--fast", action="store_true", help="Use the fastest compression level (same as --level 1)")
+    compress_parser.add_argument("--force", action="store_true", help="Compress even if the PDF looks already compressed")
+    compress_parser.add_argument("--jpeg-quality", "-q", type=int, choices=range(1, 96), default=60, metavar="[1-95]", help="JPEG quality for re-encoded images (1-95)")
+    compress_parser.add_argument("--workers", "-w", type=int, help="Number of worker processes (default: CPU count)")
     
     # Convert to Excel command
     excel_parser = subparsers.add_parser("to-excel", help="Convert PDF to Excel")
     excel_parser.add_argument("input_pdf", help="Input PDF file path")
     excel_parser.add_argument("output_excel", help="Output Excel file path")
     excel_parser.add_argument("--batch-size", "-b", type=int, default=5, help="Batch size for processing pages")
+    excel_parser.add_argument("--workers", "-w", type=int, help="Number of worker processes (default: CPU count)")
     
     # Convert to Word command
     word_parser = subparsers.add_parser("to-word", help="Convert PDF to Word")
@@ -50,11 +55,12 @@ def parse_args(args: Optional[List[str]] = None):
     word_parser.add_argument("output_word", help="Output Word file path")
     word_parser.add_argument("--start-page", "-s", type=int, default=0, help="First page to convert (0-based)")
     word_parser.add_argument("--end-page", "-e", type=int, help="Last page to convert (inclusive)")
+    word_parser.add_argument("--workers", "-w", type=int, help="Number of worker processes (default: CPU count - 1)")
     
     # Merge command
     merge_parser = subparsers.add_parser("merge", help="Merge multiple PDF files")
     merge_parser.add_argument("input_pdfs", nargs="+", help="Input PDF files to merge")
-    merge_parser.add_argument("output_pdf", help="Output PDF file path")
+    merge_parser.add_argument("output_pdf", help="Output PDF file path, or - to write the merged PDF to stdout")
     
     # Encrypt command
     encrypt_parser = subparsers.add_parser("encrypt", help="Encrypt a PDF file")
@@ -72,6 +78,90 @@ def parse_args(args: Optional[List[str]] = None):
     return parser.parse_args(args)
 
 
+def _compress(toolkit, args, logger):
+    if args.fast:
+        args.level = 1
+    logger.info(f"Compressing PDF: {args.input_pdf} -> {args.output_pdf} (level: {args.level})")
+    result = toolkit.compressor.compress(
+        args.input_pdf, 
+        args.output_pdf, 
+        compression_level=args.level,
+        jpeg_quality=args.jpeg_quality,
+        force=args.force,
+        workers=args.workers
+    )
+    return result, args.output_pdf
+
+
+def _to_excel(toolkit, args, logger):
+    logger.info(f"Converting PDF to Excel: {args.input_pdf} -> {args.output_excel}")
+    result = toolkit.excel_converter.convert(
+        args.input_pdf, 
+        args.output_excel, 
+        batch_size=args.batch_size,
+        workers=args.workers
+    )
+    return result, args.output_excel
+
+
+def _to_word(toolkit, args, logger):
+    logger.info(f"Converting PDF to Word: {args.input_pdf} -> {args.output_word}")
+    result = toolkit.word_converter.convert(
+        args.input_pdf, 
+        args.output_word, 
+        start_page=args.start_page, 
+        end_page=args.end_page,
+        workers=args.workers
+    )
+    return result, args.output_word
+
+
+def _merge(toolkit, args, logger):
+    if args.output_pdf == "-":
+        logger.info(f"Merging PDF files: {args.input_pdfs} -> stdout")
+        result = toolkit.merger.merge_to_stream(args.input_pdfs, sys.stdout.buffer)
+        return result, sys.stdout.buffer
+        
+    logger.info(f"Merging PDF files: {args.input_pdfs} -> {args.output_pdf}")
+    result = toolkit.merger.merge(
+        args.input_pdfs, 
+        args.output_pdf
+    )
+    return result, args.output_pdf
+
+
+def _encrypt(toolkit, args, logger):
+    logger.info(f"Encrypting PDF: {args.input_pdf} -> {args.output_pdf}")
+    result = toolkit.encryptor.encrypt(
+        args.input_pdf, 
+        args.password, 
+        args.output_pdf, 
+        algorithm=args.algorithm
+    )
+    return result, args.output_pdf
+
+
+def _decrypt(toolkit, args, logger):
+    logger.info(f"Decrypting PDF: {args.input_pdf} -> {args.output_pdf}")
+    result = toolkit.encryptor.decrypt(
+        args.input_pdf, 
+        args.password, 
+        args.output_pdf
+    )
+    return result, args.output_pdf
+
+
+# Command name -> (handler returning (result, expected result), action name for messages)
+COMMANDS = {
+    "compress": (_compress, "Compression"),
+    "to-excel": (_to_excel, "Conversion to Excel"),
+    "to-word": (_to_word, "Conversion to Word"),
+    "merge": (_merge, "Merging"),
+    "encrypt": (_encrypt, "Encryption"),
+    "decrypt": (_decrypt, "Decryption"),
+}
+
+
 def main():
     """
     Main entry point for the command-line interface.
@@ -82,98 +172,23 @@ def main():
     log_level = "DEBUG" if args.verbose else args.log_level
     logger = setup_logger("PDFToolkit-CLI", level=log_level, discord_webhook=args.discord_webhook)
     
+    if args.command not in COMMANDS:
+        logger.error("No command specified")
+        return 1
+    handler, action = COMMANDS[args.command]
+    
     # Create PDFToolkit instance
     toolkit = PDFToolkit(logger=logger)
     
     # Execute the requested command
-    if args.command == "compress":
-        logger.info(f"Compressing PDF: {args.input_pdf} -> {args.output_pdf} (level: {args.level})")
-        result = toolkit.compressor.compress(
-            args.input_pdf, 
-            args.output_pdf, 
-            compression_level=args.level
-        )
-        if result == args.output_pdf:
-            logger.info("Compression completed successfully")
-            return 0
-        else:
-            logger.error(f"Compression failed: {result[1]}")
-            return 1
-            
-    elif args.command == "to-excel":
-        logger.info(f"Converting PDF to Excel: {args.input_pdf} -> {args.output_excel}")
-        result = toolkit.excel_converter.convert(
-            args.input_pdf, 
-            args.output_excel, 
-            batch_size=args.batch_size
-        )
-        if result == args.output_excel:
-            logger.info("Conversion to Excel completed successfully")
-            return 0
-        else:
-            logger.error(f"Conversion to Excel failed: {result[1]}")
-            return 1
-            
-    elif args.command == "to-word":
-        logger.info(f"Converting PDF to Word: {args.input_pdf} -> {args.output_word}")
-        result = toolkit.word_converter.convert(
-            args.input_pdf, 
-            args.output_word, 
-            start_page=args.start_page, 
-            end_page=args.end_page
-        )
-        if result == args.output_word:
-            logger.info("Conversion to Word completed successfully")
-            return 0
-        else:
-            logger.error(f"Conversion to Word failed: {result[1]}")
-            return 1
-            
-    elif args.command == "merge":
-        logger.info(f"Merging PDF files: {args.input_pdfs} -> {args.output_pdf}")
-        result = toolkit.merger.merge(
-            args.input_pdfs, 
-            args.output_pdf
-        )
-        if result == args.output_pdf:
-            logger.info("Merging completed successfully")
-            return 0
-        else:
-            logger.error(f"Merging failed: {result[1]}")
-            return 1
-            
-    elif args.command == "encrypt":
-        logger.info(f"Encrypting PDF: {args.input_pdf} -> {args.output_pdf}")
-        result = toolkit.encryptor.encrypt(
-            args.input_pdf, 
-            args.password, 
-            args.output_pdf, 
-            algorithm=args.algorithm
-        )
-        if result == args.output_pdf:
-            logger.info("Encryption completed successfully")
-            return 0
-        else:
-            logger.error(f"Encryption failed: {result[1]}")
-            return 1
-            
-    elif args.command == "decrypt":
-        logger.info(f"Decrypting PDF: {args.input_pdf} -> {args.output_pdf}")
-        result = toolkit.encryptor.decrypt(
-            args.input_pdf, 
-            args.password, 
-            args.output_pdf
-        )
-        if result == args.output_pdf:
-            logger.info("Decryption completed successfully")
-            return 0
-        else:
-            logger.error(f"Decryption failed: {result[1]}")
-            return 1
-            
-    else:
-        logger.error("No command specified")
-        return 1
+    result, expected = handler(toolkit, args, logger)
+    if result == expected:
+        logger.info(f"{action} completed successfully")
+        return 0
+    
+    error = result[1] if isinstance(result, tuple) else result
+    logger.error(f"{action} failed: {error}")
+    return 1
 
 
 if __name__ == "__main__":
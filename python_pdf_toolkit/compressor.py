@@ -3,10 +3,163 @@ PDF compression functionality.
 """
 import os
 import io
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union, BinaryIO, Optional, Tuple
 from pypdf import PdfWriter, PdfReader
+from pypdf.generic import NameObject
 from .validators import validate_pdf
 from .logger import setup_logger
+from .utils import materialize_pdf, PARALLEL_PAGE_THRESHOLD, POOL_START_ERRORS
+
+# zlib level used for content streams at each compression level. Levels
+# above 6 cost much more CPU for very little size gain on content streams,
+# so the scale only reaches zlib level 9 at the very top.
+ZLIB_LEVELS = {1: 1, 2: 1, 3: 3, 4: 5, 5: 6, 6: 6, 7: 7, 8: 8, 9: 9, 10: 9}
+
+DEFAULT_JPEG_QUALITY = 60
+
+# Compressed pages waiting to be appended, per worker process
+PAGES_IN_FLIGHT_PER_WORKER = 2
+
+# Pages inspected when deciding whether a PDF is already compressed
+COMPRESSION_SAMPLE_PAGES = 8
+# Minimum decoded/encoded size ratio of content streams in an already compressed PDF
+MIN_COMPRESSED_STREAM_RATIO = 3
+# How far above the target quality a JPEG may be and still count as compressed
+JPEG_QUALITY_TOLERANCE = 5
+
+# Average of the standard JPEG luminance quantization table (ITU T.81 Annex K),
+# which libjpeg scales to reach a given quality
+_STANDARD_LUMA_AVERAGE = 57.625
+
+
+def _estimate_jpeg_quality(image) -> Optional[int]:
+    """
+    Estimate the quality a JPEG image was encoded with from its quantization tables.
+    
+    Returns:
+        Optional[int]: The estimated quality, or None if the image is not a JPEG
+    """
+    tables = getattr(image, 'quantization', None)
+    if not tables or 0 not in tables:
+        return None
+        
+    luma = tables[0]
+    scale = sum(luma) / len(luma) / _STANDARD_LUMA_AVERAGE * 100
+    if scale <= 100:
+        return round((200 - scale) / 2)
+    return round(5000 / scale)
+
+
+def _compress_page(page, quality: int, level: int) -> None:
+    """
+    Recompress the images and content streams of a single page in place.
+    
+    Images already encoded at or below the target quality, and bitonal images
+    for which JPEG is always larger, are left untouched.
+    """
+    estimate_quality = _estimate_jpeg_quality
+    for img in page.images:
+        # img.image decodes the image on every access, so read it once
+        image = img.image
+        if image.mode == '1':
+            continue
+        current_quality = estimate_quality(image)
+        if current_quality is not None and current_quality <= quality:
+            continue
+        img.replace(image, quality=quality)
+    page.compress_content_streams(level=level)
+
+
+def _is_already_compressed(reader: PdfReader, quality: int) -> bool:
+    """
+    Guess from a sample of pages whether compressing the PDF would gain anything.
+    
+    A PDF is considered already compressed when the sampled content streams are
+    all Flate-encoded with a good ratio and every sampled image is either bitonal
+    or a JPEG encoded at about the target quality or below.
+    """
+    encoded_size = decoded_size = 0
+    for page_index in range(min(COMPRESSION_SAMPLE_PAGES, len(reader.pages))):
+        page = reader.pages[page_index]
+        
+        contents = page.get('/Contents')
+        contents = contents.get_object() if contents is not None else []
+        streams = contents if isinstance(contents, list) else [contents]
+        for stream in streams:
+            stream = stream.get_object()
+            filters = stream.get('/Filter')
+            if '/FlateDecode' not in (filters if isinstance(filters, list) else [filters]):
+                return False
+            # pypdf drops /Length from parsed streams; _data holds the encoded bytes
+            encoded_size += len(stream._data)
+            decoded_size += len(stream.get_data())
+            
+        for img in page.images:
+            image = img.image
+            if image.mode == '1':
+                continue
+            current_quality = _estimate_jpeg_quality(image)
+            if current_quality is None or current_quality > quality + JPEG_QUALITY_TOLERANCE:
+                return False
+                
+    return decoded_size > 0 and decoded_size >= encoded_size * MIN_COMPRESSED_STREAM_RATIO
+
+
+# Page entries taken from the worker's compressed copy rather than the source page
+_GRAFTED_PAGE_KEYS = ('/Contents', '/Resources')
+# Excludes those entries from the page dictionaries only; without the leading
+# 1s pypdf would also drop them from every object copied along with a page
+_SOURCE_PAGE_EXCLUDED_FIELDS = [1, '/Contents', 1, '/Resources']
+
+# Source document of a compression worker process, set by _init_compress_worker
+_worker_reader = None
+
+
+def _init_compress_worker(pdf_bytes: bytes) -> None:
+    """
+    Parse the source PDF once per worker process rather than once per page.
+    """
+    global _worker_reader
+    _worker_reader = PdfReader(io.BytesIO(pdf_bytes))
+
+
+def _compress_one_page(page_index: int, quality: int, level: int) -> bytes:
+    """
+    Compress one page of the worker's source PDF.
+    
+    Args:
+        page_index: Index of the page to compress
+        quality: JPEG quality used when re-encoding images
+        level: zlib level used for content streams
+        
+    Returns:
+        bytes: A single-page PDF containing the compressed page
+    """
+    writer = PdfWriter()
+    # Annotations would pull in the pages their links point to, and only the
+    # contents and resources of this page are grafted into the output
+    page = writer.add_page(_worker_reader.pages[page_index], excluded_keys=[1, '/Annots'])
+    _compress_page(page, quality, level)
+    
+    output_buffer = io.BytesIO()
+    writer.write(output_buffer)
+    writer.close()
+    return output_buffer.getvalue()
+
+
+def _graft_compressed_page(writer: PdfWriter, page, compressed_pdf: bytes) -> None:
+    """
+    Replace the contents and resources of a page with those of its compressed copy.
+    
+    The page itself, with its annotations, stays the one appended from the source
+    document, so links to other pages keep pointing at pages of the output.
+    """
+    compressed_page = PdfReader(io.BytesIO(compressed_pdf)).pages[0]
+    for key in _GRAFTED_PAGE_KEYS:
+        if key in compressed_page:
+            page[NameObject(key)] = compressed_page.raw_get(key).clone(writer)
 
 
 class PDFCompressor:
@@ -19,10 +172,65 @@ class PDFCompressor:
         """
         self.logger = logger if logger else setup_logger("PDFCompressor")
     
+    def _compress_in_pool(self, 
+                          reader: PdfReader, 
+                          pdf_bytes: bytes,
+                          quality: int,
+                          level: int,
+                          max_workers: int) -> PdfWriter:
+        """
+        Compress the pages of a PDF across worker processes.
+        
+        Pages are appended to the output from the parent's reader, as on the serial
+        path but without their contents and resources, which come compressed from
+        the workers.
+        
+        Args:
+            reader: Reader over the source PDF
+            pdf_bytes: Content of the source PDF, sent once to each worker
+            quality: JPEG quality used when re-encoding images
+            level: zlib level used for content streams
+            max_workers: Number of worker processes
+            
+        Returns:
+            PdfWriter: Writer holding the compressed document
+        """
+        n_pages = len(reader.pages)
+        self.logger.debug(f"Compressing {n_pages} pages with {max_workers} worker processes")
+        
+        writer = PdfWriter()
+        # The uncompressed source contents and resources are never copied, so they
+        # cannot stay behind in the output once the compressed ones replace them
+        writer.append(reader, excluded_fields=_SOURCE_PAGE_EXCLUDED_FIELDS)
+        with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_compress_worker,
+                                 initargs=(pdf_bytes,)) as executor:
+            # Take finished pages in order while later pages are still being
+            # compressed, keeping a bounded number of results in flight
+            pending = deque()
+            
+            def graft_next_page():
+                page_index, future = pending.popleft()
+                _graft_compressed_page(writer, writer.pages[page_index], future.result())
+                
+            for page_index in range(n_pages):
+                future = executor.submit(_compress_one_page, page_index, quality, level)
+                pending.append((page_index, future))
+                if len(pending) >= max_workers * PAGES_IN_FLIGHT_PER_WORKER:
+                    graft_next_page()
+            while pending:
+                graft_next_page()
+                
+        # Each compressed page carries its own copy of shared resources (fonts etc.)
+        writer.compress_identical_objects(remove_identicals=True, remove_orphans=True)
+        return writer
+    
     def compress(self, 
                 input_pdf: Union[str, BinaryIO, bytes], 
                 output_path: Optional[str] = None,
-                compression_level: int = 5) -> Union[bytes, str, Tuple[bool, str]]:
+                compression_level: int = 5,
+                jpeg_quality: int = DEFAULT_JPEG_QUALITY,
+                force: bool = False,
+                workers: Optional[int] = None) -> Union[bytes, str, Tuple[bool, str]]:
         """
         Compress the input PDF.
         
@@ -30,6 +238,11 @@ class PDFCompressor:
             input_pdf: Path to a PDF file, file-like object, or bytes content
             output_path: Optional path to save the compressed PDF. If None, returns the PDF as bytes.
             compression_level: Compression level (1-10), where 10 is highest compression
+            jpeg_quality: JPEG quality (1-95) used when re-encoding images
+            force: Compress even if the PDF looks already compressed. Otherwise such
+                a PDF is saved or returned unchanged.
+            workers: Number of processes compressing pages. Defaults to the number
+                of CPUs; 1 disables multiprocessing.
             
         Returns:
             Union[bytes, str, Tuple[bool, str]]: 
@@ -37,44 +250,61 @@ class PDFCompressor:
                 - If output_path is provided: The path to the saved compressed PDF
                 - If an error occurs: A tuple (False, error_message)
         """
+        release = None
         try:
-            is_valid, error_message = validate_pdf(input_pdf)
+            source, release = materialize_pdf(input_pdf)
+            
+            is_valid, error_message = validate_pdf(source)
             if not is_valid:
                 self.logger.error(f"Validation failed: {error_message}")
                 return False, error_message
                 
             compression_level = min(max(1, compression_level), 10)
-            compress_level = compression_level * 2 if compression_level < 5 else 9
+            compress_level = ZLIB_LEVELS[compression_level]
+            jpeg_quality = min(max(1, jpeg_quality), 95)
             self.logger.debug(f"Using compression level: {compress_level}")
             
-            if isinstance(input_pdf, str):
-                reader = PdfReader(input_pdf)
-                self.logger.info(f"Reading PDF from file: {input_pdf}")
-            elif hasattr(input_pdf, 'read') and callable(input_pdf.read):
-                current_pos = input_pdf.tell()
-                
-                input_pdf.seek(0)
-                reader = PdfReader(input_pdf)
-                
-                input_pdf.seek(current_pos)
-                
-                self.logger.info("Reading PDF from file-like object")
-            elif isinstance(input_pdf, bytes):
-                reader = PdfReader(io.BytesIO(input_pdf))
-                self.logger.info("Reading PDF from bytes")
+            if isinstance(source, str):
+                with open(source, 'rb') as f:
+                    pdf_bytes = f.read()
+                self.logger.info(f"Reading PDF from file: {source}")
             else:
-                return False, "Unsupported input type"
-                
-            writer = PdfWriter()
-            for page in reader.pages:
-                writer.add_page(page)
-                
-            for page in writer.pages:
-                for img in getattr(page, 'images', []):
-                    img.replace(img.image, quality=60)
-                page.compress_content_streams(level=compress_level)
+                # Worker processes need a picklable copy of mapped or mutable buffers
+                pdf_bytes = source if isinstance(source, bytes) else bytes(source)
+                self.logger.info("Reading PDF from memory")
                 
-            writer.compress_identical_objects(remove_identicals=False, remove_orphans=True)
+            reader = PdfReader(io.BytesIO(pdf_bytes))
+            n_pages = len(reader.pages)
+            
+            if not force and _is_already_compressed(reader, jpeg_quality):
+                self.logger.info("PDF is already compressed, leaving it unchanged")
+                if output_path:
+                    with open(output_path, 'wb') as f:
+                        f.write(pdf_bytes)
+                    self.logger.info(f"Compressed PDF saved to: {output_path}")
+                    return output_path
+                return pdf_bytes
+            
+            if workers is None:
+                workers = os.cpu_count() or 1
+            max_workers = min(workers, n_pages)
+            
+            writer = None
+            if max_workers > 1 and n_pages >= PARALLEL_PAGE_THRESHOLD:
+                try:
+                    writer = self._compress_in_pool(reader, pdf_bytes, jpeg_quality, compress_level, max_workers)
+                except POOL_START_ERRORS as e:
+                    self.logger.warning(f"Could not compress pages in parallel ({e}), using a single process")
+                    
+            if writer is None:
+                writer = PdfWriter()
+                # append, unlike add_page, points links and outline items at the
+                # pages of the output rather than at detached copies of their targets
+                writer.append(reader)
+                for page in writer.pages:
+                    _compress_page(page, jpeg_quality, compress_level)
+                    
+                writer.compress_identical_objects(remove_identicals=False, remove_orphans=True)
             
             if output_path:
                 with open(output_path, 'wb') as f:
@@ -93,4 +323,7 @@ class PDFCompressor:
         except Exception as e:
             error_msg = f"An error occurred during compression: {str(e)}"
             self.logger.error(error_msg)
-            return False, error_msg
\ No newline at end of file
+            return False, error_msg
+        finally:
+            if release:
+                release()
\ No newline at end of file
@@ -4,10 +4,82 @@ PDF conversion functionality.
 import os
 import io
 import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from typing import Union, BinaryIO, Optional, List, Tuple, Dict, Any
-import pandas as pd
+import xlsxwriter
 from .validators import validate_pdf
 from .logger import setup_logger
+from .utils import materialize_pdf, as_reader, PARALLEL_PAGE_THRESHOLD, POOL_START_ERRORS
+
+# Keep intermediate files in memory-backed storage where available
+TMPFS = '/dev/shm' if os.path.isdir('/dev/shm') else None
+
+
+def _extract_tables(pdf_bytes: bytes, start: int, stop: int) -> List[List[List[List[Optional[str]]]]]:
+    """
+    Extract the tables of a contiguous range of pages.
+    
+    Args:
+        pdf_bytes: Content of the whole source PDF
+        start: Index of the first page to extract tables from
+        stop: Index one past the last page
+        
+    Returns:
+        For each page, a list of tables, each a list of rows
+    """
+    import pdfplumber
+    
+    # pdfplumber builds a Page for every page it is allowed to see, so limit
+    # it to the range (page numbers are 1-based)
+    with pdfplumber.open(io.BytesIO(pdf_bytes), pages=list(range(start + 1, stop + 1))) as pdf:
+        return [page.extract_tables() for page in pdf.pages]
+
+
+# Source document of an extraction worker process, set by _init_extract_worker
+_worker_pdf_bytes = None
+
+
+def _init_extract_worker(pdf_bytes: bytes) -> None:
+    """
+    Receive the source PDF once per worker process rather than once per task.
+    """
+    global _worker_pdf_bytes
+    _worker_pdf_bytes = pdf_bytes
+
+
+def _extract_tables_in_worker(start: int, stop: int) -> List[List[List[List[Optional[str]]]]]:
+    """
+    Extract the tables of a range of pages of the worker's source PDF.
+    """
+    return _extract_tables(_worker_pdf_bytes, start, stop)
+
+
+def _open_unnamed_file(directory: Optional[str]) -> Optional[int]:
+    """
+    Open an unnamed temporary file that the kernel reclaims once it is closed.
+    
+    Returns:
+        Optional[int]: The file descriptor, or None if O_TMPFILE is unavailable
+    """
+    if not hasattr(os, 'O_TMPFILE'):
+        return None
+    try:
+        return os.open(directory or tempfile.gettempdir(), os.O_TMPFILE | os.O_RDWR, 0o600)
+    except OSError:
+        return None
+
+
+def _column_keys(header: List[Optional[str]]) -> List[Tuple[Optional[str], int]]:
+    """
+    Build column keys for a table header, numbering repeated labels.
+    """
+    seen: Dict[Optional[str], int] = {}
+    keys = []
+    for label in header:
+        occurrence = seen.get(label, 0)
+        seen[label] = occurrence + 1
+        keys.append((label, occurrence))
+    return keys
 
 
 class PDFToExcelConverter:
@@ -17,14 +89,17 @@ class PDFToExcelConverter:
     def convert(self, 
                input_pdf: Union[str, BinaryIO, bytes], 
                output_path: Optional[str] = None,
-               batch_size: int = 5) -> Union[bytes, str, Tuple[bool, str]]:
+               batch_size: int = 5,
+               workers: Optional[int] = None) -> Union[bytes, str, Tuple[bool, str]]:
         """
         Convert PDF tables to Excel format.
         
         Args:
             input_pdf: Path to a PDF file, file-like object, or bytes content
             output_path: Optional path to save the Excel file. If None, returns the Excel file as bytes.
-            batch_size: Number of pages to process in each batch
+            batch_size: Number of pages handed to a worker process at a time
+            workers: Number of processes extracting tables. Defaults to the number
+                of CPUs; 1 disables multiprocessing.
             
         Returns:
             Union[bytes, str, Tuple[bool, str]]: 
@@ -32,8 +107,11 @@ class PDFToExcelConverter:
                 - If output_path is provided: The path to the saved Excel file
                 - If an error occurs or no tables are found: A tuple (False, error_message)
         """
+        release = None
         try:
-            is_valid, error_message = validate_pdf(input_pdf)
+            source, release = materialize_pdf(input_pdf)
+            
+            is_valid, error_message = validate_pdf(source)
             if not is_valid:
                 self.logger.error(f"Validation failed: {error_message}")
                 return False, error_message
@@ -44,82 +122,129 @@ class PDFToExcelConverter:
                 self.logger.error("pdfplumber is required for PDF to Excel conversion")
                 return False, "pdfplumber is required for PDF to Excel conversion. Install it with 'pip install pdfplumber'."
                 
-            if isinstance(input_pdf, str):
-                with pdfplumber.open(input_pdf) as pdf:
-                    return self._extract_and_save_tables(pdf, output_path, batch_size)
-            elif hasattr(input_pdf, 'read') and callable(input_pdf.read):
-                current_pos = input_pdf.tell()
+            if isinstance(source, str):
+                with open(source, 'rb') as f:
+                    content = f.read()
+            else:
+                # Worker processes need a picklable copy of mapped or mutable buffers
+                content = source if isinstance(source, bytes) else bytes(source)
                 
-                input_pdf.seek(0)
-                content = input_pdf.read()
+            # pypdf reads the page count from the page tree root, whereas
+            # pdfplumber would parse every page before the workers do it again
+            with as_reader(content) as reader:
+                total_pages = len(reader.pages)
                 
-                input_pdf.seek(current_pos)
-                
-                with pdfplumber.open(io.BytesIO(content)) as pdf:
-                    return self._extract_and_save_tables(pdf, output_path, batch_size)
-            elif isinstance(input_pdf, bytes):
-                with pdfplumber.open(io.BytesIO(input_pdf)) as pdf:
-                    return self._extract_and_save_tables(pdf, output_path, batch_size)
-            else:
-                return False, "Unsupported input type"
+            return self._extract_and_save_tables(content, total_pages, output_path, batch_size, workers)
                 
         except Exception as e:
             error_msg = f"An error occurred during PDF to Excel conversion: {str(e)}"
             self.logger.error(error_msg)
             return False, error_msg
+        finally:
+            if release:
+                release()
     
     def _extract_and_save_tables(self, 
-                               pdf, 
+                               pdf_bytes: bytes, 
+                               total_pages: int,
                                output_path: Optional[str] = None,
-                               batch_size: int = 5) -> Union[bytes, str, Tuple[bool, str]]:
+                               batch_size: int = 5,
+                               workers: Optional[int] = None) -> Union[bytes, str, Tuple[bool, str]]:
         """
         Extract tables from PDF and save to Excel.
         
         Args:
-            pdf: pdfplumber PDF object
+            pdf_bytes: Content of the PDF
+            total_pages: Number of pages in the PDF
             output_path: Path to save Excel file
-            batch_size: Number of pages to process in each batch
+            batch_size: Number of pages handed to a worker process at a time
+            workers: Number of worker processes, or None for the number of CPUs
             
         Returns:
             Union[bytes, str, Tuple[bool, str]]: Excel file as bytes, path, or error
         """
-        tables_list = []
-        total_pages = len(pdf.pages)
         self.logger.info(f"Processing PDF with {total_pages} pages")
         
-        for batch_start in range(0, total_pages, batch_size):
-            batch_end = min(batch_start + batch_size, total_pages)
-            self.logger.info(f"Processing pages {batch_start+1} to {batch_end}")
-            
-            for page in pdf.pages[batch_start:batch_end]:
-                page_tables = page.extract_tables()
-                if page_tables:
-                    for table in page_tables:
-                        if len(table) > 1:
-                            header = table[0]
-                            data = table[1:]
-                            df = pd.DataFrame(data, columns=header)
-                        else:
-                            df = pd.DataFrame(table)
-                        tables_list.append(df)
+        batch_size = max(1, batch_size)
+        starts = range(0, total_pages, batch_size)
+        stops = [min(start + batch_size, total_pages) for start in starts]
+        if workers is None:
+            workers = os.cpu_count() or 1
+        max_workers = min(workers, len(starts))
         
-        if not tables_list:
+        results = None
+        if max_workers > 1 and total_pages >= PARALLEL_PAGE_THRESHOLD:
+            try:
+                with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_extract_worker,
+                                         initargs=(pdf_bytes,)) as executor:
+                    results = [page_tables
+                               for batch in executor.map(_extract_tables_in_worker, starts, stops)
+                               for page_tables in batch]
+            except POOL_START_ERRORS as e:
+                self.logger.warning(f"Could not extract tables in parallel ({e}), using a single process")
+                
+        if results is None:
+            results = _extract_tables(pdf_bytes, 0, total_pages) if total_pages else []
+        
+        # Tables are stacked into one sheet whose columns are the union of all
+        # table headers, in order of first appearance. Tables with a single row
+        # have no header and use positional columns.
+        columns: Dict[Any, int] = {}
+        rows: List[Tuple[List[int], List[Optional[str]]]] = []
+        for page_tables in results:
+            for table in page_tables or ():
+                if not table:
+                    continue
+                if len(table) > 1:
+                    keys = _column_keys(table[0])
+                    data = table[1:]
+                else:
+                    keys = [(i, 0) for i in range(len(table[0]))]
+                    data = table
+                indices = [columns.setdefault(key, len(columns)) for key in keys]
+                rows.extend((indices, row) for row in data)
+        
+        if not columns:
             self.logger.warning("No tables found in the PDF")
             return False, "No tables found in the PDF"
-            
-        combined_df = pd.concat(tables_list, ignore_index=True)
         
         if output_path:
-            combined_df.to_excel(output_path, index=False)
+            self._write_excel(columns, rows, output_path)
             self.logger.info(f"Excel file saved to: {output_path}")
             return output_path
         else:
             output_buffer = io.BytesIO()
-            with pd.ExcelWriter(output_buffer, engine='xlsxwriter') as writer:
-                combined_df.to_excel(writer, index=False, sheet_name='Sheet1')
+            self._write_excel(columns, rows, output_buffer)
             output_buffer.seek(0)
             self.logger.info("PDF to Excel conversion completed successfully")
             return output_buffer.getvalue()
+    
+    def _write_excel(self, 
+                     columns: Dict[Any, int], 
+                     rows: List[Tuple[List[int], List[Optional[str]]]], 
+                     target: Union[str, BinaryIO]) -> None:
+        """
+        Write table rows to the first sheet of an Excel file in constant memory mode.
+        
+        Args:
+            columns: Column keys mapped to their sheet column index
+            rows: Data rows, each with the sheet column index of every cell
+            target: Path or file-like object to write the Excel file to
+        """
+        workbook = xlsxwriter.Workbook(target, {'constant_memory': True})
+        try:
+            worksheet = workbook.add_worksheet('Sheet1')
+            # constant_memory only keeps the current row, so rows are written in order
+            worksheet.write_row(0, 0, [label for label, _ in columns])
+            
+            width = len(columns)
+            for row_idx, (indices, row) in enumerate(rows, start=1):
+                cells = [None] * width
+                for col_idx, value in zip(indices, row):
+                    cells[col_idx] = value
+                worksheet.write_row(row_idx, 0, cells)
+        finally:
+            workbook.close()
 
 
 class PDFToWordConverter:
@@ -130,7 +255,8 @@ class PDFToWordConverter:
                input_pdf: Union[str, BinaryIO, bytes], 
                output_path: Optional[str] = None,
                start_page: int = 0,
-               end_page: Optional[int] = None) -> Union[bytes, str, Tuple[bool, str]]:
+               end_page: Optional[int] = None,
+               workers: Optional[int] = None) -> Union[bytes, str, Tuple[bool, str]]:
         """
         Convert PDF to Word format.
         
@@ -139,6 +265,8 @@ class PDFToWordConverter:
             output_path: Optional path to save the Word file. If None, returns the Word file as bytes.
             start_page: First page to convert (0-based)
             end_page: Last page to convert (inclusive), or None for all pages
+            workers: Number of processes used for layout analysis. Defaults to one
+                less than the number of CPUs; 1 disables multiprocessing.
             
         Returns:
             Union[bytes, str, Tuple[bool, str]]: 
@@ -146,8 +274,12 @@ class PDFToWordConverter:
                 - If output_path is provided: The path to the saved Word file
                 - If an error occurs: A tuple (False, error_message)
         """
+        release = None
+        temp_fd = None
         try:
-            is_valid, error_message = validate_pdf(input_pdf)
+            source, release = materialize_pdf(input_pdf)
+            
+            is_valid, error_message = validate_pdf(source)
             if not is_valid:
                 self.logger.error(f"Validation failed: {error_message}")
                 return False, error_message
@@ -158,28 +290,30 @@ class PDFToWordConverter:
                 self.logger.error("pdf2docx is required for PDF to Word conversion")
                 return False, "pdf2docx is required for PDF to Word conversion. Install it with 'pip install pdf2docx'."
             
-            with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf") as temp_pdf:
-                if isinstance(input_pdf, str):
-                    with open(input_pdf, 'rb') as f:
-                        temp_pdf.write(f.read())
-                elif hasattr(input_pdf, 'read') and callable(input_pdf.read):
-                    current_pos = input_pdf.tell()
-                    
-                    input_pdf.seek(0)
-                    temp_pdf.write(input_pdf.read())
-                    
-                    input_pdf.seek(current_pos)
-                elif isinstance(input_pdf, bytes):
-                    temp_pdf.write(input_pdf)
+            if isinstance(source, str):
+                # pdf2docx can read the file in place, no copy needed
+                temp_pdf_path = source
+                delete_input = False
+            else:
+                temp_fd = _open_unnamed_file(TMPFS)
+                if temp_fd is not None:
+                    with open(temp_fd, 'wb', closefd=False) as temp_pdf:
+                        temp_pdf.write(source)
+                    # Reachable by path until the descriptor is closed, also from
+                    # pdf2docx worker processes
+                    temp_pdf_path = f"/proc/{os.getpid()}/fd/{temp_fd}"
+                    delete_input = False
                 else:
-                    return False, "Unsupported input type"
-                temp_pdf_path = temp_pdf.name
+                    with tempfile.NamedTemporaryFile(delete=False, suffix=".pdf", dir=TMPFS) as temp_pdf:
+                        temp_pdf.write(source)
+                        temp_pdf_path = temp_pdf.name
+                    delete_input = True
             
             if output_path:
                 temp_docx_path = output_path
                 delete_output = False
             else:
-                temp_docx = tempfile.NamedTemporaryFile(delete=False, suffix=".docx")
+                temp_docx = tempfile.NamedTemporaryFile(delete=False, suffix=".docx", dir=TMPFS)
                 temp_docx.close()
                 temp_docx_path = temp_docx.name
                 delete_output = True
@@ -187,7 +321,18 @@ class PDFToWordConverter:
             try:
                 self.logger.info(f"Converting PDF to Word (pages {start_page} to {end_page or 'end'})")
                 cv = Converter(temp_pdf_path)
-                cv.convert(temp_docx_path, start=start_page, end=end_page)
+                
+                if workers is None:
+                    workers = max(1, (os.cpu_count() or 1) - 1)
+                total_pages = len(cv.fitz_doc)
+                n_pages = (total_pages if end_page is None else min(end_page, total_pages)) - start_page
+                
+                if workers > 1 and n_pages >= PARALLEL_PAGE_THRESHOLD:
+                    self.logger.debug(f"Converting {n_pages} pages with {workers} worker processes")
+                    cv.convert(temp_docx_path, start=start_page, end=end_page,
+                               multi_processing=True, cpu_count=workers)
+                else:
+                    cv.convert(temp_docx_path, start=start_page, end=end_page)
                 cv.close()
                 
                 if output_path:
@@ -200,20 +345,26 @@ class PDFToWordConverter:
                     return docx_data
                     
             finally:
-                try:
-                    os.remove(temp_pdf_path)
-                    self.logger.debug(f"Deleted temporary PDF file: {temp_pdf_path}")
-                except:
-                    pass
+                if delete_input:
+                    try:
+                        os.remove(temp_pdf_path)
+                        self.logger.debug(f"Deleted temporary PDF file: {temp_pdf_path}")
+                    except OSError as e:
+                        self.logger.warning(f"Could not delete temporary PDF file {temp_pdf_path}: {e}")
                     
                 if delete_output:
                     try:
                         os.remove(temp_docx_path)
                         self.logger.debug(f"Deleted temporary Word file: {temp_docx_path}")
-                    except:
-                        pass
+                    except OSError as e:
+                        self.logger.warning(f"Could not delete temporary Word file {temp_docx_path}: {e}")
                 
         except Exception as e:
             error_msg = f"An error occurred during PDF to Word conversion: {str(e)}"
             self.logger.error(error_msg)
-            return False, error_msg
\ No newline at end of file
+            return False, error_msg
+        finally:
+            if temp_fd is not None:
+                os.close(temp_fd)
+            if release:
+                release()
\ No newline at end of file
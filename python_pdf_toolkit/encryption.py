@@ -4,15 +4,315 @@ PDF encryption and decryption functionality.
 
 import os
 import io
-from typing import Union, BinaryIO, Optional, Tuple
-from pypdf import PdfWriter, PdfReader
-from .validators import validate_pdf
+import mmap
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib import import_module
+from itertools import repeat
+from typing import TYPE_CHECKING, Union, BinaryIO, List, Optional, Tuple
+from .validators import validate_pdf, MAX_FILE_SIZE
 from .logger import setup_logger
+from .utils import materialize_pdf, POOL_START_ERRORS
+
+# pypdf algorithm names that PyMuPDF can produce, with the PyMuPDF constant for
+# each. MuPDF writes AES-256 as revision 6, the standardised successor of the
+# R5 variant pypdf names.
+_PYMUPDF_ALGORITHMS = {
+    "RC4-40": "PDF_ENCRYPT_RC4_40",
+    "RC4-128": "PDF_ENCRYPT_RC4_128",
+    "AES-128": "PDF_ENCRYPT_AES_128",
+    "AES-256": "PDF_ENCRYPT_AES_256",
+    "AES-256-R5": "PDF_ENCRYPT_AES_256",
+}
+
+# Encryption settings for the pypdf algorithm names that qpdf can write; as
+# with PyMuPDF, AES-256 is written as revision 6
+_PIKEPDF_ENCRYPTIONS = {
+    "RC4-40": {"R": 2, "aes": False},
+    "RC4-128": {"R": 3, "aes": False},
+    "AES-128": {"R": 4, "aes": True},
+    "AES-256": {"R": 6, "aes": True},
+    "AES-256-R5": {"R": 6, "aes": True},
+}
+
+
+@lru_cache(maxsize=None)
+def _optional_backend(module_name: str):
+    """
+    Import an optional encryption backend (PyMuPDF or pikepdf) on first use.
+    
+    Returns:
+        The module, or None if it is not installed
+    """
+    try:
+        return import_module(module_name)
+    except ImportError:
+        return None
+
+
+def _pymupdf():
+    """
+    Import PyMuPDF on first use.
+    
+    Current releases print a deprecation warning when imported as fitz, the only
+    name releases before 1.24.3 provide, so that name is only tried second.
+    
+    Returns:
+        The module, or None if PyMuPDF is not installed
+    """
+    return _optional_backend("pymupdf") or _optional_backend("fitz")
+
+
+if TYPE_CHECKING:
+    from pypdf import PdfWriter
+
+# Paths below this size are read once up front and the same bytes are both
+# validated and parsed, instead of opening the file twice
+PREFETCH_MAX_SIZE = 8 * 1024 * 1024  # 8 MB
+
+
+def _is_same_file(input_pdf, output_path: Optional[str]) -> bool:
+    """
+    Check whether the output path names the file the input PDF is read from.
+    """
+    if not output_path or not os.path.exists(output_path):
+        return False
+    try:
+        if isinstance(input_pdf, (str, os.PathLike)):
+            return os.path.samefile(input_pdf, output_path)
+        if hasattr(input_pdf, 'fileno'):
+            input_stat = os.fstat(input_pdf.fileno())
+            output_stat = os.stat(output_path)
+            return (input_stat.st_dev, input_stat.st_ino) == (output_stat.st_dev, output_stat.st_ino)
+    except (OSError, ValueError):
+        pass
+    return False
+
+
+def _prefetch(source: Union[str, bytes, mmap.mmap], in_place: bool = False) -> Union[str, bytes, mmap.mmap]:
+    """
+    Read a small PDF file into memory, leaving other inputs unchanged.
+    
+    A PDF that is about to be overwritten by its own output is read into memory
+    whatever its size up to the validation limit: PyMuPDF and pikepdf refuse to
+    save over the file they opened, and a mapping of the file would be truncated
+    under the reader. Larger files are left for validation to reject.
+    """
+    if isinstance(source, str):
+        try:
+            size = os.path.getsize(source)
+            if size < PREFETCH_MAX_SIZE or (in_place and size <= MAX_FILE_SIZE):
+                with open(source, 'rb') as f:
+                    return f.read()
+        except OSError:
+            # Validation reports missing or unreadable files
+            pass
+    elif in_place and isinstance(source, mmap.mmap):
+        return source[:]
+    return source
+
+
+def _write_to_bytes(writer: "PdfWriter") -> bytes:
+    """
+    Serialize a pypdf writer to bytes and close it.
+    """
+    output_buffer = io.BytesIO()
+    writer.write(output_buffer)
+    writer.close()
+    # getvalue() hands over the buffer's own bytes object without copying it
+    # as long as no views of the buffer are alive
+    return output_buffer.getvalue()
+
+
+def _load_from_path(input_pdf: str, logger):
+    from pypdf import PdfReader
+    
+    logger.info(f"Reading PDF from file: {input_pdf}")
+    return PdfReader(input_pdf)
+
+
+def _load_from_bytes(input_pdf: bytes, logger):
+    from pypdf import PdfReader
+    
+    logger.info("Reading PDF from bytes")
+    return PdfReader(io.BytesIO(input_pdf))
+
+
+def _load_from_mapping(input_pdf: mmap.mmap, logger):
+    from pypdf import PdfReader
+    
+    # pypdf seeks within the mapping directly, leaving the caller's stream alone
+    logger.info("Reading PDF from file-like object")
+    return PdfReader(input_pdf)
+
+
+_LOADERS = {
+    str: _load_from_path,
+    bytes: _load_from_bytes,
+    bytearray: _load_from_bytes,
+    memoryview: _load_from_bytes,
+    mmap.mmap: _load_from_mapping,
+}
+
+
+def _load_reader(input_pdf: Union[str, bytes, mmap.mmap], logger):
+    """
+    Open a materialized PDF input with pypdf using the loader for its type.
+    
+    Returns:
+        PdfReader: The reader, or None if the input type is not supported
+    """
+    loader = _LOADERS.get(type(input_pdf))
+    if loader is None:
+        # Subclasses of the supported types, which validation accepts as well
+        loader = next((candidate for input_type, candidate in _LOADERS.items()
+                       if isinstance(input_pdf, input_type)), None)
+        if loader is None:
+            return None
+    return loader(input_pdf, logger)
+
+
+def _is_aes256_for_password(reader, password: str) -> bool:
+    """
+    Check whether a PDF is already AES-256 encrypted with the password as both
+    its owner and its user password, as encrypt() would leave it.
+    """
+    from pypdf import PasswordType
+    
+    if not reader.is_encrypted:
+        return False
+    
+    # V5 is AES-256; R5 is what pypdf writes for it and R6 what PyMuPDF and qpdf write
+    encrypt_dict = reader.trailer["/Encrypt"]
+    if encrypt_dict.get("/V") != 5 or encrypt_dict.get("/R") not in (5, 6):
+        return False
+    
+    # A permissions-only PDF opens without any password and must be encrypted for real
+    if reader.decrypt("") != PasswordType.NOT_DECRYPTED:
+        return False
+    if reader.decrypt(password) != PasswordType.OWNER_PASSWORD:
+        return False
+    
+    # pypdf stops at a matching owner password, so check the user password separately
+    return _is_aes256_user_password(encrypt_dict, password)
+
+
+def _is_aes256_user_password(encrypt_dict, password: str) -> bool:
+    """
+    Check a password against the user password entries (U/UE) of an AES-256
+    encryption dictionary.
+    
+    pypdf has no public API for this once the owner password matches, so this
+    relies on its private AlgV5 class. Any failure to import or call it counts
+    as a mismatch, which only means the PDF is encrypted again.
+    """
+    try:
+        from pypdf._encryption import AlgV5
+        
+        user_key = AlgV5.verify_user_password(
+            encrypt_dict["/R"],
+            password.encode("utf-8")[:127],
+            encrypt_dict["/U"].original_bytes,
+            encrypt_dict["/UE"].original_bytes,
+        )
+    except Exception:
+        return False
+    return bool(user_key)
+
+
+def _open_with_pymupdf(input_pdf: Union[str, bytes, mmap.mmap]):
+    """
+    Open a materialized PDF input as a PyMuPDF document.
+    
+    Returns:
+        pymupdf.Document: The opened document, or None if the input type is not supported
+    """
+    pymupdf = _pymupdf()
+    if isinstance(input_pdf, str):
+        return pymupdf.open(input_pdf)
+    elif isinstance(input_pdf, (bytes, bytearray, memoryview, mmap.mmap)):
+        # PyMuPDF only opens streams given as bytes; bytes() does not copy bytes
+        return pymupdf.open(stream=bytes(input_pdf), filetype="pdf")
+    return None
+
+
+def _open_with_pikepdf(input_pdf: Union[str, bytes, mmap.mmap]):
+    """
+    Open a materialized PDF input as a pikepdf document.
+    
+    Returns:
+        pikepdf.Pdf: The opened document, or None if the input type is not supported
+    """
+    pikepdf = _optional_backend("pikepdf")
+    if isinstance(input_pdf, str):
+        return pikepdf.open(input_pdf)
+    elif isinstance(input_pdf, (bytes, bytearray, memoryview, mmap.mmap)):
+        return pikepdf.open(io.BytesIO(input_pdf))
+    return None
+
+
+def _needs_password(input_pdf: Union[str, bytes, mmap.mmap]) -> bool:
+    """
+    Check with PyMuPDF or pikepdf, which only read the trailer and xref in C,
+    whether a PDF takes a password to open.
+    
+    Returns:
+        bool: False only if a backend opened the PDF without a password
+    """
+    if _pymupdf() is not None:
+        doc = _open_with_pymupdf(input_pdf)
+        if doc is not None:
+            try:
+                return doc.needs_pass
+            finally:
+                doc.close()
+    elif _optional_backend("pikepdf") is not None:
+        pikepdf = _optional_backend("pikepdf")
+        try:
+            pdf = _open_with_pikepdf(input_pdf)
+        except pikepdf.PasswordError:
+            return True
+        if pdf is not None:
+            pdf.close()
+            return False
+    return True
+
+
+# Whether this process has already checked which crypto provider pypdf uses
+_crypt_provider_checked = False
+
+
+def _check_crypt_provider(logger) -> None:
+    """
+    Warn once per process when pypdf has no native crypto provider.
+    
+    pypdf prefers cryptography over pycryptodome, both of which run AES natively.
+    Without either it falls back to a pure-Python implementation that only
+    supports RC4, so AES encryption and decryption fail.
+    """
+    global _crypt_provider_checked
+    if _crypt_provider_checked:
+        return
+    _crypt_provider_checked = True
+    
+    try:
+        from pypdf._crypt_providers import crypt_provider
+    except ImportError:
+        # The module is private to pypdf; without it there is nothing to check
+        return
+    
+    if crypt_provider[0] == "local_crypt_fallback":
+        logger.warning(
+            "pypdf found no crypto library and can only use RC4; "
+            "install cryptography to encrypt and decrypt with AES"
+        )
 
 
 class PDFEncryptor:
     def __init__(self, logger=None):
         self.logger = logger if logger else setup_logger("PDFEncryptor")
+        _check_crypt_provider(self.logger)
     
     def encrypt(self, 
                input_pdf: Union[str, BinaryIO, bytes], 
@@ -34,8 +334,14 @@ class PDFEncryptor:
                 - If output_path is provided: The path to the saved encrypted PDF
                 - If an error occurs: A tuple (False, error_message)
         """
+        from pypdf import PdfWriter
+        
+        release = None
         try:
-            is_valid, error_message = validate_pdf(input_pdf)
+            source, release = materialize_pdf(input_pdf)
+            source = _prefetch(source, _is_same_file(input_pdf, output_path))
+            
+            is_valid, error_message = validate_pdf(source)
             if not is_valid:
                 self.logger.error(f"Validation failed: {error_message}")
                 return False, error_message
@@ -44,28 +350,34 @@ class PDFEncryptor:
                 self.logger.error("Password is required for encryption")
                 return False, "Password is required for encryption"
             
-            if isinstance(input_pdf, str):
-                reader = PdfReader(input_pdf)
-                self.logger.info(f"Reading PDF from file: {input_pdf}")
-            elif hasattr(input_pdf, 'read') and callable(input_pdf.read):
-                current_pos = input_pdf.tell()
-                
-                input_pdf.seek(0)
-                reader = PdfReader(input_pdf)
-                
-                input_pdf.seek(current_pos)
-                
-                self.logger.info("Reading PDF from file-like object")
-            elif isinstance(input_pdf, bytes):
-                reader = PdfReader(io.BytesIO(input_pdf))
-                self.logger.info("Reading PDF from bytes")
-            else:
-                return False, "Unsupported input type"
+            reader = None
+            if algorithm == "AES-256-R5" and _needs_password(source):
+                # Re-encrypting a re-uploaded file under the same password would
+                # reproduce what it already is, so hand the source back instead.
+                # pypdf parses the whole xref in Python, so it is only asked once
+                # a native backend has found the PDF locked.
+                reader = _load_reader(source, self.logger)
+                if reader is None:
+                    return False, "Unsupported input type"
+                if _is_aes256_for_password(reader, password):
+                    return self._copy_source(source, output_path)
+            
+            # Each backend is only imported once the ones before it are ruled out
+            pymupdf = _pymupdf() if algorithm in _PYMUPDF_ALGORITHMS else None
+            if pymupdf is not None:
+                encryption = getattr(pymupdf, _PYMUPDF_ALGORITHMS[algorithm])
+                return self._encrypt_with_pymupdf(source, password, output_path, encryption)
+            
+            if algorithm in _PIKEPDF_ENCRYPTIONS and _optional_backend("pikepdf") is not None:
+                return self._encrypt_with_pikepdf(source, password, output_path, _PIKEPDF_ENCRYPTIONS[algorithm])
                 
-            writer = PdfWriter()
-            for page in reader.pages:
-                writer.add_page(page)
+            if reader is None:
+                reader = _load_reader(source, self.logger)
+                if reader is None:
+                    return False, "Unsupported input type"
                 
+            # Cloning copies the whole document in one pass instead of page by page
+            writer = PdfWriter(clone_from=reader)
             writer.encrypt(password, algorithm=algorithm)
             
             if output_path:
@@ -75,22 +387,23 @@ class PDFEncryptor:
                 self.logger.info(f"Encrypted PDF saved to: {output_path}")
                 return output_path
             else:
-                output_buffer = io.BytesIO()
-                writer.write(output_buffer)
-                writer.close()
-                output_buffer.seek(0)
+                output_pdf = _write_to_bytes(writer)
                 self.logger.info("PDF encryption completed successfully")
-                return output_buffer.getvalue()
+                return output_pdf
                 
         except Exception as e:
             error_msg = f"An error occurred during encryption: {str(e)}"
             self.logger.error(error_msg)
             return False, error_msg
+        finally:
+            if release:
+                release()
     
     def decrypt(self, 
                input_pdf: Union[str, BinaryIO, bytes], 
                password: str,
-               output_path: Optional[str] = None) -> Union[bytes, str, Tuple[bool, str]]:
+               output_path: Optional[str] = None,
+               fast: bool = True) -> Union[bytes, str, Tuple[bool, str]]:
         """
         Decrypt the input PDF with a password.
         
@@ -98,6 +411,9 @@ class PDFEncryptor:
             input_pdf: Path to a PDF file, file-like object, or bytes content
             password: Password to decrypt the PDF
             output_path: Optional path to save the decrypted PDF. If None, returns the PDF as bytes.
+            fast: Keep PyMuPDF's default save. Pass False to also garbage-collect unused
+                objects and recompress streams, which is slower but gives a smaller file.
+                Has no effect without PyMuPDF.
             
         Returns:
             Union[bytes, str, Tuple[bool, str]]: 
@@ -105,8 +421,14 @@ class PDFEncryptor:
                 - If output_path is provided: The path to the saved decrypted PDF
                 - If an error occurs: A tuple (False, error_message)
         """
+        from pypdf import PdfWriter
+        
+        release = None
         try:
-            is_valid, error_message = validate_pdf(input_pdf)
+            source, release = materialize_pdf(input_pdf)
+            source = _prefetch(source, _is_same_file(input_pdf, output_path))
+            
+            is_valid, error_message = validate_pdf(source)
             if not is_valid:
                 self.logger.error(f"Validation failed: {error_message}")
                 return False, error_message
@@ -115,22 +437,14 @@ class PDFEncryptor:
                 self.logger.error("Password is required for decryption")
                 return False, "Password is required for decryption"
             
-            if isinstance(input_pdf, str):
-                reader = PdfReader(input_pdf)
-                self.logger.info(f"Reading PDF from file: {input_pdf}")
-            elif hasattr(input_pdf, 'read') and callable(input_pdf.read):
-                current_pos = input_pdf.tell()
-                
-                input_pdf.seek(0)
-                reader = PdfReader(input_pdf)
-                
-                input_pdf.seek(current_pos)
+            if _pymupdf() is not None:
+                return self._decrypt_with_pymupdf(source, password, output_path, fast)
+            
+            if not fast:
+                self.logger.info("fast=False has no effect without PyMuPDF; saving with pypdf")
                 
-                self.logger.info("Reading PDF from file-like object")
-            elif isinstance(input_pdf, bytes):
-                reader = PdfReader(io.BytesIO(input_pdf))
-                self.logger.info("Reading PDF from bytes")
-            else:
+            reader = _load_reader(source, self.logger)
+            if reader is None:
                 return False, "Unsupported input type"
                 
             if not reader.is_encrypted:
@@ -143,10 +457,9 @@ class PDFEncryptor:
                 self.logger.error("Incorrect password or failed to decrypt the PDF")
                 return False, "Incorrect password or failed to decrypt the PDF"
                 
-            writer = PdfWriter()
-            for page in reader.pages:
-                writer.add_page(page)
-                
+            # Cloning copies the whole document in one pass instead of page by page
+            writer = PdfWriter(clone_from=reader)
+            
             if output_path:
                 with open(output_path, 'wb') as f:
                     writer.write(f)
@@ -154,14 +467,192 @@ class PDFEncryptor:
                 self.logger.info(f"Decrypted PDF saved to: {output_path}")
                 return output_path
             else:
-                output_buffer = io.BytesIO()
-                writer.write(output_buffer)
-                writer.close()
-                output_buffer.seek(0)
+                output_pdf = _write_to_bytes(writer)
                 self.logger.info("PDF decryption completed successfully")
-                return output_buffer.getvalue()
+                return output_pdf
                 
         except Exception as e:
             error_msg = f"An error occurred during decryption: {str(e)}"
             self.logger.error(error_msg)
-            return False, error_msg
\ No newline at end of file
+            return False, error_msg
+        finally:
+            if release:
+                release()
+    
+    def encrypt_many(self, 
+                     inputs: List[str], 
+                     password: str,
+                     output_dir: str,
+                     algorithm: str = "AES-256-R5",
+                     workers: Optional[int] = None) -> Union[List[Union[str, Tuple[bool, str]]], Tuple[bool, str]]:
+        """
+        Encrypt several PDF files with the same password, one worker process per file.
+        
+        Args:
+            inputs: Paths of the PDF files to encrypt
+            password: Password to encrypt the PDFs with
+            output_dir: Directory to save the encrypted PDFs in, under their original names
+            algorithm: Encryption algorithm to use
+            workers: Number of worker processes (default: CPU count)
+            
+        Returns:
+            Union[List[Union[str, Tuple[bool, str]]], Tuple[bool, str]]: 
+                - The result of encrypt() for each input, in order
+                - If the batch cannot be started: A tuple (False, error_message)
+        """
+        try:
+            if not password:
+                self.logger.error("Password is required for encryption")
+                return False, "Password is required for encryption"
+                
+            output_paths = [os.path.join(output_dir, os.path.basename(path)) for path in inputs]
+            if len(set(output_paths)) != len(output_paths):
+                self.logger.error("Input files must have distinct names")
+                return False, "Input files must have distinct names"
+                
+            os.makedirs(output_dir, exist_ok=True)
+            
+            max_workers = min(workers or os.cpu_count() or 1, len(inputs))
+            if max_workers > 1:
+                # pypdf serialization holds the GIL, so documents are spread over processes
+                self.logger.info(f"Encrypting {len(inputs)} PDFs with {max_workers} worker processes")
+                try:
+                    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                        return list(executor.map(_encrypt_one, inputs, repeat(password), output_paths, repeat(algorithm)))
+                except POOL_START_ERRORS as e:
+                    self.logger.warning(f"Could not encrypt in parallel ({e}), using a single process")
+                    
+            return [self.encrypt(path, password, output_path, algorithm)
+                    for path, output_path in zip(inputs, output_paths)]
+                
+        except Exception as e:
+            error_msg = f"An error occurred during batch encryption: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def _copy_source(self, 
+                     source: Union[str, bytes, mmap.mmap], 
+                     output_path: Optional[str]) -> Union[bytes, str]:
+        """
+        Save or return an already encrypted source PDF unchanged.
+        """
+        self.logger.info("PDF is already encrypted with AES-256 under this password")
+        if output_path:
+            if isinstance(source, str):
+                shutil.copyfile(source, output_path)
+            else:
+                with open(output_path, 'wb') as f:
+                    f.write(source)
+            self.logger.info(f"Encrypted PDF saved to: {output_path}")
+            return output_path
+        else:
+            if isinstance(source, str):
+                with open(source, 'rb') as f:
+                    return f.read()
+            return bytes(source)
+    
+    def _encrypt_with_pymupdf(self, 
+                              input_pdf: Union[str, bytes, mmap.mmap], 
+                              password: str,
+                              output_path: Optional[str],
+                              encryption: int) -> Union[bytes, str, Tuple[bool, str]]:
+        """
+        Encrypt the input PDF with PyMuPDF, which copies the document in C.
+        """
+        doc = _open_with_pymupdf(input_pdf)
+        if doc is None:
+            return False, "Unsupported input type"
+            
+        try:
+            self.logger.info("Encrypting PDF with PyMuPDF")
+            if output_path:
+                doc.save(output_path, encryption=encryption, owner_pw=password, user_pw=password)
+                self.logger.info(f"Encrypted PDF saved to: {output_path}")
+                return output_path
+            else:
+                encrypted_pdf = doc.tobytes(encryption=encryption, owner_pw=password, user_pw=password)
+                self.logger.info("PDF encryption completed successfully")
+                return encrypted_pdf
+        finally:
+            doc.close()
+    
+    def _encrypt_with_pikepdf(self, 
+                              input_pdf: Union[str, bytes, mmap.mmap], 
+                              password: str,
+                              output_path: Optional[str],
+                              settings: dict) -> Union[bytes, str, Tuple[bool, str]]:
+        """
+        Encrypt the input PDF with pikepdf, which lets qpdf copy the objects in C.
+        """
+        pikepdf = _optional_backend("pikepdf")
+        pdf = _open_with_pikepdf(input_pdf)
+        if pdf is None:
+            return False, "Unsupported input type"
+            
+        try:
+            # qpdf encrypts the stream data as it is, without decoding it, and
+            # refuses any stream_decode_level together with encryption
+            encryption = pikepdf.Encryption(owner=password, user=password, **settings)
+            
+            self.logger.info("Encrypting PDF with pikepdf")
+            if output_path:
+                pdf.save(output_path, encryption=encryption)
+                self.logger.info(f"Encrypted PDF saved to: {output_path}")
+                return output_path
+            else:
+                output_buffer = io.BytesIO()
+                pdf.save(output_buffer, encryption=encryption)
+                self.logger.info("PDF encryption completed successfully")
+                return output_buffer.getvalue()
+        finally:
+            pdf.close()
+    
+    def _decrypt_with_pymupdf(self, 
+                              input_pdf: Union[str, bytes, mmap.mmap], 
+                              password: str,
+                              output_path: Optional[str],
+                              fast: bool = True) -> Union[bytes, str, Tuple[bool, str]]:
+        """
+        Decrypt the input PDF with PyMuPDF, which copies the document in C.
+        """
+        pymupdf = _pymupdf()
+        doc = _open_with_pymupdf(input_pdf)
+        if doc is None:
+            return False, "Unsupported input type"
+            
+        try:
+            if not doc.needs_pass and not doc.metadata.get("encryption"):
+                self.logger.warning("The PDF is not encrypted")
+                return False, "The PDF is not encrypted"
+                
+            if not doc.authenticate(password):
+                self.logger.error("Incorrect password or failed to decrypt the PDF")
+                return False, "Incorrect password or failed to decrypt the PDF"
+                
+            # PyMuPDF's default save; cleaning up is opt-in because it costs a full
+            # pass over every object and stream
+            if fast:
+                save_options = {}
+            else:
+                save_options = {"garbage": 3, "deflate": True}
+                
+            self.logger.info("Decrypting PDF with PyMuPDF")
+            if output_path:
+                doc.save(output_path, encryption=pymupdf.PDF_ENCRYPT_NONE, **save_options)
+                self.logger.info(f"Decrypted PDF saved to: {output_path}")
+                return output_path
+            else:
+                decrypted_pdf = doc.tobytes(encryption=pymupdf.PDF_ENCRYPT_NONE, **save_options)
+                self.logger.info("PDF decryption completed successfully")
+                return decrypted_pdf
+        finally:
+            doc.close()
+
+
+def _encrypt_one(input_path: str, password: str, output_path: str, algorithm: str) -> Union[str, Tuple[bool, str]]:
+    """
+    Encrypt one PDF file in a worker process.
+    
+    Loggers cannot be pickled, so each worker builds its own encryptor.
+    """
+    return PDFEncryptor().encrypt(input_path, password, output_path, algorithm)
@@ -3,15 +3,40 @@ Logging utilities for the PDFToolkit package.
 """
 
 import logging
-from typing import Optional, Union
-from discrd_logger import DiscordLogger
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from discrd_logger import DiscordLogger
+
+# Shared by every handler setup_logger attaches
+_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+@lru_cache(maxsize=None)
+def _discord_logger(name: str, level: str, discord_webhook: str) -> "DiscordLogger":
+    from discrd_logger import DiscordLogger
+    
+    return DiscordLogger(
+        webhook_url=discord_webhook, 
+        app_name=name, 
+        min_level=level
+    )
 
 def setup_logger(name: str = "PDFToolkit", 
                 level: str = "INFO", 
-                discord_webhook: Optional[str] = None) -> Union[logging.Logger, DiscordLogger]:
+                discord_webhook: Optional[str] = None) -> Union[logging.Logger, "DiscordLogger"]:
     """
     Set up and return a logger instance.
     
+    Repeated calls with the same arguments return the same logger.
+    
     Args:
         name: Logger name
         level: Logging level
@@ -21,20 +46,23 @@ def setup_logger(name: str = "PDFToolkit",
         Logger instance (either standard Logger or DiscordLogger)
     """
     if discord_webhook:
-        return DiscordLogger(
-            webhook_url=discord_webhook, 
-            app_name=name, 
-            min_level=level
-        )
+        return _discord_logger(name, level, discord_webhook)
     
+    # Standard loggers are already cached by the logging module; the level is
+    # still applied on every call so the latest caller's choice wins
     logger = logging.getLogger(name)
-    level_num = getattr(logging, level, logging.INFO)
+    level_num = _LEVELS.get(level)
+    if level_num is None:
+        # Names outside the table, such as WARN, FATAL or NOTSET
+        level_num = getattr(logging, level, logging.INFO)
     logger.setLevel(level_num)
     
     if not logger.handlers:
         handler = logging.StreamHandler()
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
+        handler.setFormatter(_FORMATTER)
         logger.addHandler(handler)
+        # The handler above already emits every record; stop ancestors with
+        # handlers of their own from printing it a second time
+        logger.propagate = False
         
-    return logger
\ No newline at end of file
+    return logger
@@ -3,11 +3,16 @@ PDF merging functionality.
 """
 
 import os
-import io
+import tempfile
+from contextlib import ExitStack
 from typing import Union, BinaryIO, List, Optional, Tuple
-from pypdf import PdfWriter, PdfReader
+from pypdf import PdfWriter
 from .validators import validate_pdf
 from .logger import setup_logger
+from .utils import materialize_pdf, as_reader
+
+# Merged output larger than this is spooled to a temporary file
+SPOOL_MAX_SIZE = 64 * 1024 * 1024  # 64 MB
 
 
 class PDFMerger:
@@ -31,60 +36,116 @@ class PDFMerger:
                 - If an error occurs: A tuple (False, error_message)
         """
         try:
-            if not input_pdfs:
-                self.logger.error("No PDF files provided for merging")
-                return False, "No PDF files provided for merging"
+            # Inputs stay open until the merged PDF is written
+            with ExitStack() as stack:
+                merger = self._build_merger(input_pdfs, stack)
+                if isinstance(merger, tuple):
+                    return merger
                 
-            if len(input_pdfs) < 2:
-                self.logger.error("At least two PDF files are required for merging")
-                return False, "At least two PDF files are required for merging"
+                if output_path:
+                    with open(output_path, 'wb') as f:
+                        merger.write(f)
+                    merger.close()
+                    self.logger.info(f"Merged PDF saved to: {output_path}")
+                    return output_path
+                else:
+                    # Large merges spill to disk instead of being held in memory twice
+                    with tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE, mode='w+b') as output_buffer:
+                        merger.write(output_buffer)
+                        merger.close()
+                        output_buffer.seek(0)
+                        merged_pdf = output_buffer.read()
+                    self.logger.info("PDF merging completed successfully")
+                    return merged_pdf
                 
-            for i, pdf in enumerate(input_pdfs):
-                is_valid, error_message = validate_pdf(pdf)
-                if not is_valid:
-                    self.logger.error(f"Validation failed for PDF #{i+1}: {error_message}")
-                    return False, f"Validation failed for PDF #{i+1}: {error_message}"
-            
-            merger = PdfWriter()
-            
-            for i, pdf in enumerate(input_pdfs):
-                try:
-                    if isinstance(pdf, str):
-                        self.logger.info(f"Adding PDF #{i+1} from file: {pdf}")
-                        merger.append(pdf)
-                    elif hasattr(pdf, 'read') and callable(pdf.read):
-                        current_pos = pdf.tell()
-                        
-                        pdf.seek(0)
-                        merger.append(pdf)
-                        
-                        pdf.seek(current_pos)
-                        
-                        self.logger.info(f"Adding PDF #{i+1} from file-like object")
-                    elif isinstance(pdf, bytes):
-                        merger.append(io.BytesIO(pdf))
-                        self.logger.info(f"Adding PDF #{i+1} from bytes")
-                    else:
-                        return False, f"Unsupported input type for PDF #{i+1}"
-                except Exception as e:
-                    self.logger.error(f"Error adding PDF #{i+1}: {e}")
-                    return False, f"Error adding PDF #{i+1}: {str(e)}"
+        except Exception as e:
+            error_msg = f"An error occurred during PDF merging: {str(e)}"
+            self.logger.error(error_msg)
+            return False, error_msg
+    
+    def merge_to_stream(self, 
+                        input_pdfs: List[Union[str, BinaryIO, bytes]], 
+                        out_stream: BinaryIO) -> Union[BinaryIO, Tuple[bool, str]]:
+        """
+        Merge multiple PDF files, writing the result directly to a stream.
+        
+        Args:
+            input_pdfs: List of PDF files (paths, file-like objects, or bytes)
+            out_stream: Writable binary stream receiving the merged PDF
             
-            if output_path:
-                with open(output_path, 'wb') as f:
-                    merger.write(f)
-                merger.close()
-                self.logger.info(f"Merged PDF saved to: {output_path}")
-                return output_path
-            else:
-                output_buffer = io.BytesIO()
-                merger.write(output_buffer)
+        Returns:
+            Union[BinaryIO, Tuple[bool, str]]: 
+                - The output stream on success
+                - If an error occurs: A tuple (False, error_message)
+        """
+        try:
+            # Inputs stay open until the merged PDF is written
+            with ExitStack() as stack:
+                merger = self._build_merger(input_pdfs, stack)
+                if isinstance(merger, tuple):
+                    return merger
+                
+                merger.write(out_stream)
                 merger.close()
-                output_buffer.seek(0)
-                self.logger.info("PDF merging completed successfully")
-                return output_buffer.getvalue()
+            out_stream.flush()
+            self.logger.info("PDF merging completed successfully")
+            return out_stream
                 
         except Exception as e:
             error_msg = f"An error occurred during PDF merging: {str(e)}"
             self.logger.error(error_msg)
-            return False, error_msg
\ No newline at end of file
+            return False, error_msg
+    
+    def _build_merger(self, 
+                      input_pdfs: List[Union[str, BinaryIO, bytes]],
+                      stack: ExitStack) -> Union[PdfWriter, Tuple[bool, str]]:
+        """
+        Validate the input PDFs and append them to a new writer.
+        
+        Args:
+            input_pdfs: List of PDF files (paths, file-like objects, or bytes)
+            stack: Exit stack that keeps the inputs open; pypdf may still read from
+                them when the writer is written, so close it only after that
+            
+        Returns:
+            Union[PdfWriter, Tuple[bool, str]]: The writer holding all pages, or (False, error_message)
+        """
+        if not input_pdfs:
+            self.logger.error("No PDF files provided for merging")
+            return False, "No PDF files provided for merging"
+            
+        if len(input_pdfs) < 2:
+            self.logger.error("At least two PDF files are required for merging")
+            return False, "At least two PDF files are required for merging"
+            
+        readers = []
+        for i, pdf in enumerate(input_pdfs):
+            source, release = materialize_pdf(pdf)
+            stack.callback(release)
+            
+            is_valid, error_message = validate_pdf(source)
+            if not is_valid:
+                self.logger.error(f"Validation failed for PDF #{i+1}: {error_message}")
+                return False, f"Validation failed for PDF #{i+1}: {error_message}"
+            
+            try:
+                self.logger.info(f"Reading PDF #{i+1}")
+                readers.append(stack.enter_context(as_reader(source)))
+            except TypeError:
+                return False, f"Unsupported input type for PDF #{i+1}"
+            except Exception as e:
+                self.logger.error(f"Error reading PDF #{i+1}: {e}")
+                return False, f"Error reading PDF #{i+1}: {str(e)}"
+        
+        merger = PdfWriter()
+        
+        # Appending the already parsed readers avoids a second parse of every input
+        for i, reader in enumerate(readers):
+            try:
+                merger.append(reader)
+                self.logger.debug(f"Added PDF #{i+1}")
+            except Exception as e:
+                self.logger.error(f"Error adding PDF #{i+1}: {e}")
+                return False, f"Error adding PDF #{i+1}: {str(e)}"
+        
+        return merger
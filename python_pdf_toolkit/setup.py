@@ -18,11 +18,10 @@ setup(
         "Operating System :: OS Independent",
     ],
     packages=find_packages(),
-    python_requires=">=3.6",
+    python_requires=">=3.8",
     install_requires=[
         "pypdf==5.3.0",
-        "python-magic==0.4.27",
-        "pandas==2.2.3",
+        "cryptography>=41",
         "xlsxwriter==3.2.2",
     ],
     extras_require={
@@ -31,6 +30,9 @@ setup(
         "discord": [
             "discord-logger-handler==0.1.2",
         ],
+        "numba": ["numba>=0.57"],
+        "pymupdf": ["PyMuPDF>=1.23"],
+        "pikepdf": ["pikepdf>=8"],
         "all": [
             "pdfplumber==0.11.5",
             "pdf2docx==0.5.8", 
@@ -0,0 +1,123 @@
+"""
+Input handling utilities shared by the PDFToolkit modules.
+"""
+
+import io
+import mmap
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
+from functools import singledispatch
+from pathlib import PurePath
+from typing import Any, BinaryIO, Callable, Iterator, Tuple, Union
+
+from .validators import MAX_FILE_SIZE
+
+# Below this many pages, process pool startup costs more than it saves
+PARALLEL_PAGE_THRESHOLD = 4
+
+# Raised when a process pool cannot start its workers, e.g. from inside a
+# daemonic worker process (Celery prefork, multiprocessing.Pool) or where
+# process creation is not permitted; callers fall back to a single process
+POOL_START_ERRORS = (AssertionError, BrokenProcessPool, NotImplementedError, OSError)
+
+
+def _noop() -> None:
+    pass
+
+
+@singledispatch
+def materialize_pdf(input_pdf: Union[str, BinaryIO, bytes],
+                    max_size: int = MAX_FILE_SIZE) -> Tuple[Any, Callable[[], None]]:
+    """
+    Turn a PDF input into a single view that can be validated and parsed.
+
+    Paths and in-memory buffers are returned unchanged (pathlib paths as str).
+    File-like objects backed by a real file descriptor are memory-mapped, other
+    file-like objects are read once from the start, leaving their position
+    untouched. Unseekable streams are read from their current position.
+    Unsupported inputs are returned as-is so that validation reports them.
+
+    Streams are never read past max_size: a seekable stream that is too large
+    is returned unread, and at most max_size + 1 bytes of an unseekable one,
+    so that validation rejects either by size.
+
+    Args:
+        input_pdf: Path to a PDF file, file-like object, or bytes content
+        max_size: Size above which stream content is not read in full
+
+    Returns:
+        Tuple[Any, Callable[[], None]]: The path or buffer, and a function releasing it
+    """
+    # Duck-typed file objects that do not derive from io.IOBase
+    if hasattr(input_pdf, 'read') and callable(input_pdf.read):
+        return _materialize_stream(input_pdf, max_size)
+    return input_pdf, _noop
+
+
+@materialize_pdf.register(str)
+@materialize_pdf.register(bytes)
+@materialize_pdf.register(bytearray)
+@materialize_pdf.register(memoryview)
+@materialize_pdf.register(mmap.mmap)
+def _materialize_unchanged(input_pdf, max_size=MAX_FILE_SIZE):
+    return input_pdf, _noop
+
+
+@materialize_pdf.register(PurePath)
+def _materialize_path(input_pdf, max_size=MAX_FILE_SIZE):
+    return str(input_pdf), _noop
+
+
+@materialize_pdf.register(io.IOBase)
+def _materialize_stream(input_pdf, max_size=MAX_FILE_SIZE):
+    try:
+        view = mmap.mmap(input_pdf.fileno(), 0, access=mmap.ACCESS_READ)
+    except (AttributeError, OSError, ValueError):
+        # Pipes and other unseekable streams can only be read once, from here
+        seekable = getattr(input_pdf, 'seekable', None)
+        if seekable is not None and not seekable():
+            return input_pdf.read(max_size + 1), _noop
+        
+        current_pos = input_pdf.tell()
+
+        # Leave oversized streams unread; validation measures them the same way
+        if input_pdf.seek(0, io.SEEK_END) > max_size:
+            input_pdf.seek(current_pos)
+            return input_pdf, _noop
+
+        input_pdf.seek(0)
+        content = input_pdf.read()
+
+        input_pdf.seek(current_pos)
+        return content, _noop
+    return view, view.close
+
+
+@contextmanager
+def as_reader(input_pdf: Union[str, BinaryIO, bytes]) -> Iterator[Any]:
+    """
+    Open a PDF input with pypdf, reading it only once.
+
+    Args:
+        input_pdf: Path to a PDF file, file-like object, or bytes content
+
+    Yields:
+        PdfReader: Reader over the PDF, valid until the context exits
+
+    Raises:
+        TypeError: If the input type is not supported
+    """
+    from pypdf import PdfReader
+
+    source, release = materialize_pdf(input_pdf)
+    try:
+        if isinstance(source, (str, mmap.mmap)):
+            # pypdf reads a path itself and can seek within a mapping directly
+            reader = PdfReader(source)
+        elif isinstance(source, (bytes, bytearray, memoryview)):
+            reader = PdfReader(io.BytesIO(source))
+        else:
+            raise TypeError("Unsupported input type")
+        yield reader
+    finally:
+        release()
@@ -2,12 +2,16 @@
 Validation utilities for PDF files.
 """
 
+import io
 import os
-import magic
+import mmap
+import stat
 from typing import BinaryIO, Union, Tuple, Optional
 
 MAX_FILE_SIZE = 30 * 1024 * 1024  # 30 MB
-ALLOWED_MIME_TYPES = ['application/pdf']
+PDF_HEADER = b"%PDF-"
+# The header read as one little-endian integer, for the common at-offset-0 case
+_PDF_HEADER_INT = int.from_bytes(PDF_HEADER, 'little')
 
 
 class ValidationError(Exception):
@@ -15,13 +19,76 @@ class ValidationError(Exception):
     pass
 
 
+def _find_header(content: bytes) -> int:
+    """
+    Return the offset of the PDF header in the content, or -1 if missing.
+    """
+    return content.find(PDF_HEADER)
+
+
+def _load_header_kernel():
+    """
+    Build the numba header scanner, or return None if numba is unavailable.
+    
+    Compiling (or loading from the on-disk cache) happens here, on the first
+    search that needs it, so importing the package never pays for numba.
+    """
+    if os.environ.get("PDFTOOLKIT_NO_NUMBA") == "1":
+        return None
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+    
+    header_array = np.frombuffer(PDF_HEADER, dtype=np.uint8)
+    
+    @njit(cache=True, nogil=True, fastmath=True)
+    def _scan_header(buf, header):
+        n = header.shape[0]
+        for i in range(buf.shape[0] - n + 1):
+            j = 0
+            while j < n and buf[i + j] == header[j]:
+                j += 1
+            if j == n:
+                return i
+        return -1
+    
+    def _find_header_jit(content: bytes) -> int:
+        return _scan_header(np.frombuffer(content, dtype=np.uint8), header_array)
+    
+    # A bytes buffer gives the same read-only array type used later
+    try:
+        _find_header_jit(bytes(16))
+    except Exception:
+        return None
+    return _find_header_jit
+
+
+# Header search used for PDFs whose header is not at offset 0, chosen on first use
+_header_search = None
+
+
+def _search_header(content: bytes) -> int:
+    """
+    Return the offset of the PDF header in the content, or -1 if missing,
+    using the numba scanner when it is available.
+    """
+    global _header_search
+    if _header_search is None:
+        _header_search = _load_header_kernel() or _find_header
+    return _header_search(content)
+
+
 def validate_pdf_mime(file_content: bytes) -> bool:
     """
-    Validate that the file content is a PDF based on MIME type.
+    Validate that the file content is a PDF based on its header signature.
     """
-    mime = magic.Magic(mime=True)
-    file_mime_type = mime.from_buffer(file_content[:1024])
-    return file_mime_type in ALLOWED_MIME_TYPES
+    # Nearly every PDF starts with its header, which a single integer compare
+    # confirms; the rest may carry a preamble, so search the allowed window
+    if int.from_bytes(file_content[:5], 'little') == _PDF_HEADER_INT:
+        return True
+    return _search_header(file_content[:1024]) != -1
 
 
 def validate_pdf_size(file_size: int, max_size: int = MAX_FILE_SIZE) -> bool:
@@ -31,10 +98,29 @@ def validate_pdf_size(file_size: int, max_size: int = MAX_FILE_SIZE) -> bool:
     return file_size <= max_size
 
 
-def validate_pdf(file: Union[str, BinaryIO, bytes], 
+def _regular_file(file) -> Optional[Tuple[int, int]]:
+    """
+    Return the descriptor and size of a file object backed by a regular file.
+    """
+    if not hasattr(os, 'pread'):
+        return None
+    try:
+        fd = file.fileno()
+        file_stat = os.fstat(fd)
+    except (AttributeError, OSError, ValueError):
+        return None
+    if not stat.S_ISREG(file_stat.st_mode):
+        return None
+    return fd, file_stat.st_size
+
+
+def validate_pdf(file: Union[str, BinaryIO, bytes, memoryview, mmap.mmap], 
                 max_size: int = MAX_FILE_SIZE) -> Tuple[bool, Optional[str]]:
     """
     Validate that the file is a valid PDF and meets size requirements.
+    
+    Accepts a path, a file-like object, or an in-memory buffer (bytes,
+    bytearray, memoryview or mmap).
     """
     try:
         if isinstance(file, str):
@@ -45,19 +131,50 @@ def validate_pdf(file: Union[str, BinaryIO, bytes],
             if not validate_pdf_size(file_size, max_size):
                 return False, f"File size exceeds the maximum limit of {max_size / (1024 * 1024):.2f} MB"
             
-            with open(file, 'rb') as f:
-                content = f.read(1024)
-                if not validate_pdf_mime(content):
+            # An empty file cannot be mapped, and cannot be a PDF either
+            if file_size == 0:
+                return False, "File is not a valid PDF"
+            
+            # Map only the header page so the check shares the OS page cache
+            # with the parser that opens the path afterwards
+            with open(file, 'rb') as f, \
+                    mmap.mmap(f.fileno(), min(file_size, 1024), access=mmap.ACCESS_READ) as mm:
+                if not validate_pdf_mime(mm[:1024]):
                     return False, "File is not a valid PDF"
                 
+        elif isinstance(file, (bytes, bytearray, memoryview, mmap.mmap)):
+            if not validate_pdf_size(len(file), max_size):
+                return False, f"File size exceeds the maximum limit of {max_size / (1024 * 1024):.2f} MB"
+            
+            if not validate_pdf_mime(bytes(file[:1024])):
+                return False, "Content is not a valid PDF"
+                
         elif hasattr(file, 'read') and callable(file.read):
-            if hasattr(file, 'size'):
-                file_size = file.size
+            regular_file = _regular_file(file)
+            if regular_file is not None:
+                # Read the header by offset so the caller's position is never moved
+                fd, file_size = regular_file
                 if not validate_pdf_size(file_size, max_size):
                     return False, f"File size exceeds the maximum limit of {max_size / (1024 * 1024):.2f} MB"
+                
+                if not validate_pdf_mime(os.pread(fd, 1024, 0)):
+                    return False, "File is not a valid PDF"
+                return True, None
+            
+            # Checking a pipe would consume it; callers materialize such streams first
+            seekable = getattr(file, 'seekable', None)
+            if seekable is not None and not seekable():
+                return False, "Cannot validate an unseekable stream without consuming it"
             
             current_pos = file.tell()
             
+            # Measure the stream before sniffing it so oversized inputs are
+            # rejected without reading any content
+            file_size = file.seek(0, io.SEEK_END)
+            if not validate_pdf_size(file_size, max_size):
+                file.seek(current_pos)
+                return False, f"File size exceeds the maximum limit of {max_size / (1024 * 1024):.2f} MB"
+            
             file.seek(0)
             content = file.read(1024)
             
@@ -65,13 +182,6 @@ def validate_pdf(file: Union[str, BinaryIO, bytes],
             
             if not validate_pdf_mime(content):
                 return False, "File is not a valid PDF"
-                
-        elif isinstance(file, bytes):
-            if not validate_pdf_size(len(file), max_size):
-                return False, f"File size exceeds the maximum limit of {max_size / (1024 * 1024):.2f} MB"
-            
-            if not validate_pdf_mime(file[:1024]):
-                return False, "Content is not a valid PDF"
         else:
             return False, "Unsupported file type"
             
@@ -0,0 +1,39 @@
+import io
+
+from pypdf import PdfReader, PdfWriter
+from pypdf.generic import ContentStream
+
+from python_pdf_toolkit.compressor import PDFCompressor
+
+
+def _make_pdf(n_pages: int = 2) -> bytes:
+    writer = PdfWriter()
+    for page_number in range(n_pages):
+        page = writer.add_blank_page(width=612, height=792)
+        contents = ContentStream(None, None)
+        contents.set_data(b"0 0 1 rg " + b"10 10 100 100 re f " * 200 + str(page_number).encode())
+        page.replace_contents(contents)
+        page.compress_content_streams()
+    output_buffer = io.BytesIO()
+    writer.write(output_buffer)
+    return output_buffer.getvalue()
+
+
+def test_compress_with_default_arguments():
+    pdf_bytes = _make_pdf()
+    
+    result = PDFCompressor().compress(pdf_bytes)
+    
+    assert isinstance(result, bytes), result
+    assert len(PdfReader(io.BytesIO(result)).pages) == 2
+
+
+def test_compress_to_path_with_default_arguments(tmp_path):
+    input_path = tmp_path / "input.pdf"
+    input_path.write_bytes(_make_pdf())
+    output_path = str(tmp_path / "output.pdf")
+    
+    result = PDFCompressor().compress(str(input_path), output_path)
+    
+    assert result == output_path
+    assert len(PdfReader(output_path).pages) == 2